@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.base import get_session as get_db
-from app.services.bc import BlockchainService
-from app.schemas.bc import BlockResponse, BlockchainInfo
+from app.services.blockchain import BlockchainService
+from app.schemas.blockchain import BlockHeader, BlockResponse, BlockchainInfo
 
 router = APIRouter(prefix="/blockchain", tags=["区块链"])
 
@@ -27,6 +28,28 @@ async def get_blocks(
     return [BlockResponse.from_orm(block) for block in blocks]
 
 
+@router.get("/headers", summary="获取区块头（二进制）", response_class=Response)
+async def get_headers(
+        from_index: int = Query(0, ge=0, alias="from", description="起始区块索引"),
+        count: int = Query(2000, ge=1, le=10000, description="区块头数量"),
+        db: AsyncSession = Depends(get_db)
+):
+    """按索引升序返回连续的区块头，每个区块头固定 BlockHeader.SIZE 字节，
+    可用 BlockHeader.unpack_many 解码，供轻客户端校验哈希链"""
+    service = BlockchainService(db)
+    headers = await service.get_headers(from_index=from_index, count=count)
+    # 先完整编码再返回，编码出错时直接返回 500，而不是截断的 200 响应
+    body = b"".join(header.pack() for header in headers)
+    return Response(
+        content=body,
+        media_type="application/octet-stream",
+        headers={
+            "X-Header-Size": str(BlockHeader.SIZE),
+            "X-Header-Count": str(len(headers)),
+        },
+    )
+
+
 @router.get("/blocks/{block_hash}", response_model=BlockResponse, summary="根据哈希获取区块")
 async def get_block_by_hash(
         block_hash: str,
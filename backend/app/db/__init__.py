@@ -1,3 +1,3 @@
 # Re-export common DB objects for IDE friendliness
-from .base import Base, SessionLocal, engine  # noqa: F401
-__all__ = ["Base", "SessionLocal", "engine"]
\ No newline at end of file
+from .base import Base, dispose_engine, get_session, init_engine, warm_engine  # noqa: F401
+__all__ = ["Base", "dispose_engine", "get_session", "init_engine", "warm_engine"]
@@ -1,8 +1,24 @@
-from fastapi import FastAPI, Depends, HTTPException
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import auth, chain
 
-app = FastAPI(title="Donate Chain API", version="0.1.0")
+from app.api.v1 import auth, blockchain
+from app.db import base as db_base
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """启动时创建并预热连接池；退出时释放连接池。"""
+    db_base.init_engine()
+    await db_base.warm_engine()
+    try:
+        yield
+    finally:
+        await db_base.dispose_engine()
+
+
+app = FastAPI(title="Donate Chain API", version="0.1.0", lifespan=lifespan)
 
 # 允许前端调用
 app.add_middleware(
@@ -15,7 +31,7 @@ app.add_middleware(
 
 # 注册路由
 app.include_router(auth.router)
-app.include_router(chain.router)
+app.include_router(blockchain.router)
 # app.include_router(rankings.router)
 # app.include_router(meta.router)
 # app.include_router(apps.router)
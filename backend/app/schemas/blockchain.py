@@ -1,5 +1,6 @@
+import struct
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 
 
@@ -38,4 +39,74 @@ class TransactionData(BaseModel):
     amount: float = Field(..., description="捐赠金额")
     currency: str = Field(default="CNY", description="货币类型")
     message: Optional[str] = Field(None, description="捐赠留言")
-    timestamp: datetime = Field(..., description="交易时间")
\ No newline at end of file
+    timestamp: datetime = Field(..., description="交易时间")
+
+
+class BlockHeader:
+    """紧凑区块头：只包含哈希链校验需要的字段，data 只保留 SHA-256 摘要。
+
+    内存中使用 __slots__，传输时编码为固定 122 字节（大端）：
+    index(u64) | timestamp 微秒(i64) | nonce(u64) | difficulty(u16) |
+    previous_hash(32B) | hash(32B) | data_digest(32B)
+
+    timestamp 编码为距 1970-01-01 UTC 的微秒数。数据库返回的 naive datetime
+    按 UTC 处理，因此 MySQL 会话时区需要是 UTC（time_zone='+00:00'），
+    否则解码结果会偏移服务器时区的差值。
+    """
+
+    __slots__ = ("index", "timestamp", "previous_hash", "hash", "nonce", "difficulty", "data_digest")
+
+    STRUCT = struct.Struct("!QqQH32s32s32s")
+    SIZE = STRUCT.size
+    EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, index: int, timestamp: datetime, previous_hash: str, hash: str,
+                 nonce: int, difficulty: int, data_digest: str):
+        self.index = index
+        self.timestamp = timestamp
+        self.previous_hash = previous_hash
+        self.hash = hash
+        self.nonce = nonce
+        self.difficulty = difficulty
+        self.data_digest = data_digest
+
+    def pack(self) -> bytes:
+        """编码为固定长度的二进制"""
+        timestamp = self.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        timestamp_us = (timestamp - self.EPOCH) // timedelta(microseconds=1)
+        return self.STRUCT.pack(
+            self.index,
+            timestamp_us,
+            self.nonce,
+            self.difficulty,
+            bytes.fromhex(self.previous_hash),
+            bytes.fromhex(self.hash),
+            bytes.fromhex(self.data_digest),
+        )
+
+    @classmethod
+    def unpack(cls, buffer: bytes, offset: int = 0) -> "BlockHeader":
+        """从二进制解码一个区块头"""
+        index, timestamp_us, nonce, difficulty, previous_hash, hash_value, data_digest = \
+            cls.STRUCT.unpack_from(buffer, offset)
+        return cls(
+            index=index,
+            timestamp=cls.EPOCH + timedelta(microseconds=timestamp_us),
+            previous_hash=previous_hash.hex(),
+            hash=hash_value.hex(),
+            nonce=nonce,
+            difficulty=difficulty,
+            data_digest=data_digest.hex(),
+        )
+
+    @classmethod
+    def unpack_many(cls, buffer: bytes) -> List["BlockHeader"]:
+        """解码 /blockchain/headers 返回的连续区块头"""
+        if len(buffer) % cls.SIZE:
+            raise ValueError("区块头数据长度不是固定长度的整数倍")
+        return [cls.unpack(buffer, offset) for offset in range(0, len(buffer), cls.SIZE)]
+
+    def __repr__(self) -> str:
+        return f"BlockHeader(index={self.index}, hash={self.hash!r})"
@@ -4,8 +4,8 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func, and_
-from app.db.models.bc import Block
-from app.schemas.bc import BlockResponse, BlockchainInfo, TransactionData
+from app.db.models.blockchain import Block
+from app.schemas.blockchain import BlockHeader, BlockResponse, BlockchainInfo, TransactionData
 import asyncio
 
 
@@ -56,6 +56,41 @@ class BlockchainService:
         )
         return result.scalars().all()
 
+    async def get_headers(self, from_index: int = 0, count: int = 2000) -> List[BlockHeader]:
+        """按索引升序获取区块头，data 在数据库中计算摘要，不加载原文"""
+        result = await self.db.execute(
+            select(
+                Block.index,
+                Block.timestamp,
+                Block.previous_hash,
+                Block.hash,
+                Block.nonce,
+                Block.difficulty,
+                func.sha2(Block.data, 256),
+            )
+            .where(Block.index >= from_index)
+            .order_by(Block.index)
+            .limit(count)
+        )
+        return [BlockHeader(*row) for row in result.all()]
+
+    @staticmethod
+    def verify_headers(headers: List[BlockHeader], previous: Optional[BlockHeader] = None) -> bool:
+        """仅根据区块头验证哈希链接和难度要求
+
+        区块哈希基于 data 原文计算，区块头中只有摘要，因此这里只能校验
+        哈希满足难度前缀以及 previous_hash 链接；完整校验见 validate_chain。
+        """
+        for header in headers:
+            if not header.hash.startswith("0" * header.difficulty):
+                return False
+            if previous is not None and (
+                    header.index != previous.index + 1 or header.previous_hash != previous.hash
+            ):
+                return False
+            previous = header
+        return True
+
     async def create_genesis_block(self) -> Block:
         """创建创世区块"""
         genesis_data = {
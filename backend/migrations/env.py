@@ -17,6 +17,8 @@ if str(BASE_DIR) not in sys.path:
 # access to the values within the .ini file in use.
 config = context.config
 from app.db.base import Base
+# 导入模型以注册到 Base.metadata（base.py 不再在 import 时加载模型）
+from app.db.models import blockchain, donation, user  # noqa: F401,E402
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,63 @@
+"""启动耗时基准：统计 `import app.main` 的 import 耗时（python -X importtime）。
+
+uvicorn 多 worker 部署时每个 worker 都会重新 import app.main，这里的耗时
+基本就是单个 worker 的冷启动开销（不含 lifespan 中的数据库连接预热）。
+
+用法（在 backend 目录下）：
+    python scripts/bench_startup.py            # 默认跑 5 次，输出中位数和最慢的模块
+    python scripts/bench_startup.py -n 10 --top 30
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import pathlib
+
+BACKEND_DIR = pathlib.Path(__file__).resolve().parents[1]
+
+
+def run_importtime(module: str) -> list[tuple[int, int, str]]:
+    """在子进程中 import 模块，返回 [(self_us, cumulative_us, name), ...]"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} 失败:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # 格式: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        rows.append((int(parts[0]), int(parts[1]), parts[2].rstrip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="统计应用 import 耗时")
+    parser.add_argument("-m", "--module", default="app.main", help="要 import 的模块")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="运行次数")
+    parser.add_argument("--top", type=int, default=20, help="输出累计耗时最多的模块数")
+    args = parser.parse_args()
+
+    totals = []
+    rows = []
+    for _ in range(args.runs):
+        rows = run_importtime(args.module)
+        totals.append(sum(self_us for self_us, _, _ in rows))
+
+    print(f"import {args.module}: 中位数 {statistics.median(totals) / 1000:.1f} ms, "
+          f"最小 {min(totals) / 1000:.1f} ms, 最大 {max(totals) / 1000:.1f} ms ({args.runs} 次)")
+    print(f"\n累计耗时 Top {args.top}（最后一次运行）:")
+    for _, cumulative, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()